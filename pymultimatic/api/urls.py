@@ -1,5 +1,6 @@
 """Vaillant API Urls.
 """
+import functools
 from typing import Any
 from urllib import parse
 
@@ -111,26 +112,31 @@ _ZONE_COOLING_MANUAL_SETPOINT_TEMPERATURE = (
 )
 
 
+@functools.lru_cache(maxsize=1024)
 def base(**kwargs: Any) -> str:
     """Base url of the API."""
     return _BASE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def new_token(**kwargs: Any) -> str:
     """Url to request a new token."""
     return _NEW_TOKEN.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def authenticate(**kwargs: Any) -> str:
     """Url to authenticate the user and receive cookies."""
     return _AUTHENTICATE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def logout(**kwargs: Any) -> str:
     """Url to logout from the API, cookies are invalidated."""
     return _LOGOUT.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def facilities_list(**kwargs: Any) -> str:
     """Url to get the list of serial numbers of the facilities (and some other
     properties).
@@ -141,26 +147,31 @@ def facilities_list(**kwargs: Any) -> str:
     return _FACILITIES_LIST.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def gateway_type(**kwargs: Any) -> str:
     """Url to get the gateway type (VR900, VR920, etc.)."""
     return _GATEWAY_TYPE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def rbr_underfloor_heating_status(**kwargs: Any) -> str:
     """Url to check if underfloor heating is installed or not."""
     return _RBR_UNDERFLOOR_HEATING_STATUS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def rbr_installation_status(**kwargs: Any) -> str:
     """Url to check the room by room installation status."""
     return _RBR_INSTALLATION_STATUS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def rooms(**kwargs: Any) -> str:
     """Url to get the list of :class:`~pymultimatic.model.component.Room`."""
     return _ROOMS_LIST.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room(**kwargs: Any) -> str:
     """Url to get specific room details (configuration, timeprogram). Or to
     delete a :class:`~pymultimatic.model.component.Room`.
@@ -168,6 +179,7 @@ def room(**kwargs: Any) -> str:
     return _ROOM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_configuration(**kwargs: Any) -> str:
     """Url to get configuration for a
     :class:`~pymultimatic.model.component.Room` (name, temperature,
@@ -176,6 +188,7 @@ def room_configuration(**kwargs: Any) -> str:
     return _ROOM_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_quick_veto(**kwargs: Any) -> str:
     """Url to handle :class:`~pymultimatic.model.mode.QuickVeto` for a
     :class:`~pymultimatic.model.component.Room`.
@@ -183,11 +196,13 @@ def room_quick_veto(**kwargs: Any) -> str:
     return _ROOM_QUICK_VETO.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_operating_mode(**kwargs: Any) -> str:
     """Url to set operating for a :class:`~pymultimatic.model.component.Room`."""
     return _ROOM_OPERATING_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_timeprogram(**kwargs: Any) -> str:
     """Url to get/update configuration for a
     class:`~pymultimatic.model.component.Room`. (name, temperature,
@@ -196,6 +211,7 @@ def room_timeprogram(**kwargs: Any) -> str:
     return _ROOM_TIMEPROGRAM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_child_lock(**kwargs: Any) -> str:
     """Url to handle child lock for all
     :class:`~pymultimatic.model.component.Device` in a
@@ -204,16 +220,19 @@ def room_child_lock(**kwargs: Any) -> str:
     return _ROOM_CHILD_LOCK.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_name(**kwargs: Any) -> str:
     """Set :class:`~pymultimatic.model.component.Room` name."""
     return _ROOM_NAME.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_device_name(**kwargs: Any) -> str:
     """Set :class:`~pymultimatic.model.component.Device` name."""
     return _ROOM_DEVICE_NAME.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def room_temperature_setpoint(**kwargs: Any) -> str:
     """Url to handle target temperature for a
     :class:`~pymultimatic.model.component.Room`.
@@ -221,37 +240,44 @@ def room_temperature_setpoint(**kwargs: Any) -> str:
     return _ROOM_TEMPERATURE_SETPOINT.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def repeaters(**kwargs: Any) -> str:
     """Url to get list of repeaters"""
     return _REPEATERS_LIST.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def delete_repeater(**kwargs: Any) -> str:
     """Url to delete a repeater."""
     return _REPEATER_DELETE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def repeater_name(**kwargs: Any) -> str:
     """Url to set repeater's name."""
     return _REPEATER_SET_NAME.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hvac(**kwargs: Any) -> str:
     """Url of the hvac overview."""
     return _HVAC.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hvac_update(**kwargs: Any) -> str:
     """Url to request an hvac update."""
     return _HVAC_REQUEST_UPDATE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def live_report(**kwargs: Any) -> str:
     """Url to get live report data (current boiler water temperature, current
     hot water temperature, etc.)."""
     return _LIVE_REPORT.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def live_report_device(**kwargs: Any) -> str:
     """
     Url to get live report for specific device
@@ -259,16 +285,19 @@ def live_report_device(**kwargs: Any) -> str:
     return _LIVE_REPORT_DEVICE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def photovoltaics(**kwargs: Any) -> str:
     """Url to get photovoltaics data."""
     return _PHOTOVOLTAICS_REPORT.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def emf_devices(**kwargs: Any) -> str:
     """Url to get emf (Embedded Metering Function) report."""
     return _EMF_DEVICES.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def emf_report_device(
     energy_type: str, function: str, time_range: str, start: str, offset: str, **kwargs: Any
 ) -> str:
@@ -287,21 +316,25 @@ def emf_report_device(
     return "{}?{}".format(url, parse.urlencode(query_params))
 
 
+@functools.lru_cache(maxsize=1024)
 def facilities_details(**kwargs: Any) -> str:
     """Url to get facility detail."""
     return _FACILITIES_DETAILS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def facilities_status(**kwargs: Any) -> str:
     """Url to get facility status."""
     return _FACILITIES_STATUS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def facilities_settings(**kwargs: Any) -> str:
     """Url to get facility settings."""
     return _FACILITIES_SETTINGS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def facilities_default_settings(**kwargs: Any) -> str:
     """
     Url to get facility default settings
@@ -309,11 +342,13 @@ def facilities_default_settings(**kwargs: Any) -> str:
     return _FACILITIES_DEFAULT_SETTINGS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def facilities_installer_info(**kwargs: Any) -> str:
     """Url to get facility default settings."""
     return _FACILITIES_INSTALLER_INFO.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system(**kwargs: Any) -> str:
     """Url to get full :class:`~pymultimatic.model.system.System` (zones, dhw,
     ventilation, holiday mode, etc.) except
@@ -322,36 +357,43 @@ def system(**kwargs: Any) -> str:
     return _SYSTEM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_configuration(**kwargs: Any) -> str:
     """Url to get system configuration (holiday mode, quick mode etc.)."""
     return _SYSTEM_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_status(**kwargs: Any) -> str:
     """Url to get outdoor temperature and datetime."""
     return _SYSTEM_STATUS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_datetime(**kwargs: Any) -> str:
     """Url to set datetime."""
     return _SYSTEM_DATETIME.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_parameters(**kwargs: Any) -> str:
     """Url to get system parameters."""
     return _SYSTEM_PARAMETERS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_quickmode(**kwargs: Any) -> str:
     """Url to get system :class:`~pymultimatic.model.mode.QuickMode`."""
     return _SYSTEM_QUICK_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_holiday_mode(**kwargs: Any) -> str:
     """Url to get system :class:`~pymultimatic.model.mode.HolidayMode`."""
     return _SYSTEM_HOLIDAY_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def dhw(**kwargs: Any) -> str:
     """Url to get domestic hot water
     (:class:`~pymultimatic.model.component.HotWater` and
@@ -360,6 +402,7 @@ def dhw(**kwargs: Any) -> str:
     return _DHW.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def dhws(**kwargs: Any) -> str:
     """Url to get all domestic hot water
     (:class:`~pymultimatic.model.component.HotWater` and
@@ -368,11 +411,13 @@ def dhws(**kwargs: Any) -> str:
     return _DHWS.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def circulation(**kwargs: Any) -> str:
     """Url to get :class:`~pymultimatic.model.component.Circulation` details."""
     return _CIRCULATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def circulation_configuration(**kwargs: Any) -> str:
     """Url to handle :class:`~pymultimatic.model.component.Circulation`
     configuration.
@@ -380,6 +425,7 @@ def circulation_configuration(**kwargs: Any) -> str:
     return _CIRCULATION_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def circulation_timeprogram(**kwargs: Any) -> str:
     """Url to handle :class:`~pymultimatic.model.component.Circulation`
     :class:`~pymultimatic.model.timeprogram.TimeProgram`.
@@ -387,11 +433,13 @@ def circulation_timeprogram(**kwargs: Any) -> str:
     return _CIRCULATION_TIMEPROGRAM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hot_water(**kwargs: Any) -> str:
     """Url to get :class:`~pymultimatic.model.component.HotWater` detail."""
     return _HOT_WATER.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hot_water_configuration(**kwargs: Any) -> str:
     """Url to handle :class:`~pymultimatic.model.component.HotWater`
     configuration.
@@ -399,6 +447,7 @@ def hot_water_configuration(**kwargs: Any) -> str:
     return _HOT_WATER_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hot_water_timeprogram(**kwargs: Any) -> str:
     """Url to handle :class:`~pymultimatic.model.component.HotWater`
     :class:`~pymultimatic.model.timeprogram.TimeProgram`.
@@ -406,6 +455,7 @@ def hot_water_timeprogram(**kwargs: Any) -> str:
     return _HOT_WATER_TIMEPROGRAM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hot_water_operating_mode(**kwargs: Any) -> str:
     """Url to set :class:`~pymultimatic.model.component.HotWater`
     operating mode, only if it's not a quick action.
@@ -413,6 +463,7 @@ def hot_water_operating_mode(**kwargs: Any) -> str:
     return _HOT_WATER_OPERATING_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def hot_water_temperature_setpoint(**kwargs: Any) -> str:
     """Url to set :class:`~pymultimatic.model.component.HotWater`
     temperature setpoint.
@@ -420,31 +471,37 @@ def hot_water_temperature_setpoint(**kwargs: Any) -> str:
     return _HOT_WATER_TEMPERATURE_SETPOINT.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def ventilation(**kwargs: Any) -> str:
     """Url to get ventilation details."""
     return _VENTILATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def system_ventilation(**kwargs: Any) -> str:
     """Url to get ventilation details."""
     return _SYSTEM_VENTILATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def ventilation_configuration(**kwargs: Any) -> str:
     """Url to get ventilation configuration."""
     return _VENTILATION_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def ventilation_timeprogram(**kwargs: Any) -> str:
     """Url to get ventilation timeprogram."""
     return _VENTILATION_TIMEPROGRAM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def set_ventilation_day_level(**kwargs: Any) -> str:
     """Url to set ventilation day level."""
     return _VENTILATION_DAY_LEVEL.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def set_ventilation_night_level(**kwargs: Any) -> str:
     """
     Url to set ventilation night level
@@ -452,21 +509,25 @@ def set_ventilation_night_level(**kwargs: Any) -> str:
     return _VENTILATION_NIGHT_LEVEL.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def set_ventilation_operating_mode(**kwargs: Any) -> str:
     """Url to set ventilation operating mode."""
     return _VENTILATION_OPERATING_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zones(**kwargs: Any) -> str:
     """Url to get :class:`~pymultimatic.model.component.Zone`."""
     return _ZONES_LIST.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone(**kwargs: Any) -> str:
     """Url to get a specific :class:`~pymultimatic.model.component.Zone`."""
     return _ZONE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_configuration(**kwargs: Any) -> str:
     """Url to get a specific :class:`~pymultimatic.model.component.Zone`
     configuration.
@@ -474,11 +535,13 @@ def zone_configuration(**kwargs: Any) -> str:
     return _ZONE_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_name(**kwargs: Any) -> str:
     """Url to set :class:`~pymultimatic.model.component.Zone` name."""
     return _ZONE_NAME.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_quick_veto(**kwargs: Any) -> str:
     """Url to get :class:`~pymultimatic.model.mode.QuickVeto` for a
     :class:`~pymultimatic.model.component.Zone`.
@@ -486,6 +549,7 @@ def zone_quick_veto(**kwargs: Any) -> str:
     return _ZONE_QUICK_VETO.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_heating_configuration(**kwargs: Any) -> str:
     """Url to get :class:`~pymultimatic.model.component.Zone` heating
     configuration.
@@ -493,6 +557,7 @@ def zone_heating_configuration(**kwargs: Any) -> str:
     return _ZONE_HEATING_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_heating_timeprogram(**kwargs: Any) -> str:
     """Url to get a :class:`~pymultimatic.model.component.Zone` heating
     :class:`~pymultimatic.model.timeprogram.TimeProgram`.
@@ -500,11 +565,13 @@ def zone_heating_timeprogram(**kwargs: Any) -> str:
     return _ZONE_HEATING_TIMEPROGRAM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_heating_mode(**kwargs: Any) -> str:
     """Url to get a :class:`~pymultimatic.model.component.Zone` heating mode."""
     return _ZONE_HEATING_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_heating_setpoint_temperature(**kwargs: Any) -> str:
     """Url to set a :class:`~pymultimatic.model.component.Zone` setpoint
     temperature.
@@ -512,6 +579,7 @@ def zone_heating_setpoint_temperature(**kwargs: Any) -> str:
     return _ZONE_HEATING_SETPOINT_TEMPERATURE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_heating_setback_temperature(**kwargs: Any) -> str:
     """Url to set a :class:`~pymultimatic.model.component.Zone` setback
     temperature.
@@ -519,6 +587,7 @@ def zone_heating_setback_temperature(**kwargs: Any) -> str:
     return _ZONE_HEATING_SETBACK_TEMPERATURE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_cooling_configuration(**kwargs: Any) -> str:
     """Url to get a :class:`~pymultimatic.model.component.Zone` cooling
     configuration.
@@ -526,6 +595,7 @@ def zone_cooling_configuration(**kwargs: Any) -> str:
     return _ZONE_COOLING_CONFIGURATION.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_cooling_timeprogram(**kwargs: Any) -> str:
     """Url to get :class:`~pymultimatic.model.component.Zone` cooling
     timeprogram.
@@ -533,11 +603,13 @@ def zone_cooling_timeprogram(**kwargs: Any) -> str:
     return _ZONE_COOLING_TIMEPROGRAM.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_cooling_mode(**kwargs: Any) -> str:
     """Url to set a :class:`~pymultimatic.model.component.Zone` cooling mode."""
     return _ZONE_COOLING_MODE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_cooling_setpoint_temperature(**kwargs: Any) -> str:
     """Url to set the cooling temperature setpoint for a
     :class:`~pymultimatic.model.component.Zone`.
@@ -545,6 +617,7 @@ def zone_cooling_setpoint_temperature(**kwargs: Any) -> str:
     return _ZONE_COOLING_SETPOINT_TEMPERATURE.format(**kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
 def zone_cooling_manual_setpoint_temperature(**kwargs: Any) -> str:
     """Url to set manual cooling setpoint temperature for a
     :class:`~pymultimatic.model.component.Zone`.
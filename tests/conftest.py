@@ -1,6 +1,8 @@
-import os
+import asyncio
+import functools
 from http.cookies import SimpleCookie
-from typing import AsyncGenerator, Optional
+from pathlib import Path
+from typing import Any, AsyncGenerator, Generator, Optional
 
 import pytest
 from aiohttp import ClientSession
@@ -25,8 +27,25 @@ from pymultimatic.model import (
     ZoneHeating,
 )
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads  # type: ignore
 
-@pytest.fixture(autouse=True, name="session")
+try:
+    from uvloop import new_event_loop as _new_event_loop
+except ImportError:
+    from asyncio import new_event_loop as _new_event_loop  # type: ignore
+
+
+@pytest.fixture(scope="session")
+def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = _new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True, name="session", scope="session")
 async def fixture_session() -> AsyncGenerator[ClientSession, None]:
     async with ClientSession() as sess:
         yield sess
@@ -39,15 +58,26 @@ async def resp(raw_resp: aioresponses) -> AsyncGenerator[aioresponses, None]:
     yield raw_resp
 
 
-@pytest.fixture(name="raw_resp")
-async def fixture_raw_resp() -> AsyncGenerator[aioresponses, None]:
+@pytest.fixture(name="shared_resp", scope="session")
+def fixture_shared_resp() -> Generator[aioresponses, None, None]:
     with aioresponses() as aioreponses:
         yield aioreponses
-        aioreponses.clear()
+
+
+@pytest.fixture(name="raw_resp")
+def fixture_raw_resp(shared_resp: aioresponses) -> Generator[aioresponses, None, None]:
+    yield shared_resp
+    shared_resp.clear()
+    shared_resp.requests.clear()
 
 
 @pytest.fixture(autouse=True)
 async def connector(session: ClientSession) -> AsyncGenerator[Connector, None]:
+    yield mock_connector(session)
+    session.cookie_jar.clear()
+
+
+def mock_connector(session: ClientSession) -> Connector:
     con = Connector("test", "test", session)
     orig_login = con.login
 
@@ -62,7 +92,7 @@ async def connector(session: ClientSession) -> AsyncGenerator[Connector, None]:
         return result
 
     setattr(con, "login", new_login)
-    yield con
+    return con
 
 
 def mock_auth(resp_mock: aioresponses) -> None:
@@ -175,5 +205,15 @@ def _ventilation() -> Ventilation:
     return ventilation
 
 
-def path(file: str) -> str:
-    return os.path.join(os.path.dirname(__file__), file) + ".json"
+_RESPONSES_DIR = Path(__file__).parent / "files" / "responses"
+
+_RESPONSES = {file.stem: file.read_bytes() for file in _RESPONSES_DIR.glob("*.json")}
+
+
+def parse_response(name: str) -> Any:
+    return _loads(_RESPONSES[name])
+
+
+@functools.lru_cache(maxsize=None)
+def load_response(name: str) -> Any:
+    return parse_response(name)
@@ -1,19 +1,16 @@
 from unittest import mock
 
-import pytest
 from aioresponses import aioresponses
 
 from pymultimatic.api import ApiError, Connector, urls
 
 
-@pytest.mark.asyncio
 async def test_login_success(connector: Connector, resp: aioresponses) -> None:
     assert await connector.login()
     assert await connector.is_logged()
     assert await connector.login()
 
 
-@pytest.mark.asyncio
 async def test_login_auth_error(connector: Connector, raw_resp: aioresponses) -> None:
     raw_resp.post(urls.new_token(), status=200, payload={"body": {"authToken": "123"}})
     raw_resp.post(urls.authenticate(), status=401)
@@ -27,7 +24,6 @@ async def test_login_auth_error(connector: Connector, raw_resp: aioresponses) ->
     assert not await connector.is_logged()
 
 
-@pytest.mark.asyncio
 async def test_login_login_error(connector: Connector, raw_resp: aioresponses) -> None:
     raw_resp.post(urls.new_token(), status=401)
 
@@ -40,7 +36,6 @@ async def test_login_login_error(connector: Connector, raw_resp: aioresponses) -
     assert not await connector.is_logged()
 
 
-@pytest.mark.asyncio
 async def test_auto_login_before_request(connector: Connector, resp: aioresponses) -> None:
     with mock.patch.object(connector, "login", wraps=connector.login) as mock_login:
         mock_payload = {"test": "test"}
@@ -54,7 +49,6 @@ async def test_auto_login_before_request(connector: Connector, resp: aioresponse
         mock_login.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_login_error_before_request(connector: Connector, raw_resp: aioresponses) -> None:
     with mock.patch.object(connector, "login", wraps=connector.login) as mock_login:
         raw_resp.post(urls.new_token(), status=401)
@@ -69,7 +63,6 @@ async def test_login_error_before_request(connector: Connector, raw_resp: aiores
         assert not await connector.is_logged()
 
 
-@pytest.mark.asyncio
 async def test_delete(connector: Connector, resp: aioresponses) -> None:
     url = urls.facilities_list(serial="123")
 
@@ -77,7 +70,6 @@ async def test_delete(connector: Connector, resp: aioresponses) -> None:
     await connector.delete(url)
 
 
-@pytest.mark.asyncio
 async def test_put(connector: Connector, resp: aioresponses) -> None:
     url = urls.facilities_list(serial="123")
 
@@ -85,7 +77,6 @@ async def test_put(connector: Connector, resp: aioresponses) -> None:
     await connector.put(url)
 
 
-@pytest.mark.asyncio
 async def test_get(connector: Connector, resp: aioresponses) -> None:
     url = urls.facilities_list(serial="123")
 
@@ -93,7 +84,6 @@ async def test_get(connector: Connector, resp: aioresponses) -> None:
     await connector.get(url)
 
 
-@pytest.mark.asyncio
 async def test_post(connector: Connector, resp: aioresponses) -> None:
     url = urls.facilities_list(serial="123")
 
@@ -1,83 +1,74 @@
 """Test for the model mapper."""
+import copy
 import json
 import unittest
 from datetime import date, datetime
 
 from pymultimatic.model import ActiveFunction, OperatingModes, QuickModes, mapper
-from tests.conftest import path
+from tests.conftest import load_response
 
 
 class MapperTest(unittest.TestCase):
     """Test class."""
 
     def test_map_quick_mode(self) -> None:
-        with open(path("files/responses/quick_mode"), "r") as file:
-            json_raw = json.loads(file.read())
-            q_m = mapper.map_quick_mode(json_raw)
-            self.assertEqual(QuickModes.SYSTEM_OFF, q_m)
-            self.assertEqual(0, q_m.duration)
+        json_raw = load_response("quick_mode")
+        q_m = mapper.map_quick_mode(json_raw)
+        self.assertEqual(QuickModes.SYSTEM_OFF, q_m)
+        self.assertEqual(0, q_m.duration)
 
     def test_map_quick_mode_no_duration(self) -> None:
-        with open(path("files/responses/quick_mode_no_duration"), "r") as file:
-            json_raw = json.loads(file.read())
-            q_m = mapper.map_quick_mode(json_raw)
-            self.assertEqual(QuickModes.SYSTEM_OFF, q_m)
-            self.assertIsNone(q_m.duration)
+        json_raw = load_response("quick_mode_no_duration")
+        q_m = mapper.map_quick_mode(json_raw)
+        self.assertEqual(QuickModes.SYSTEM_OFF, q_m)
+        self.assertIsNone(q_m.duration)
 
     def test_map_holiday(self) -> None:
-        with open(path("files/responses/holiday_mode"), "r") as file:
-            json_raw = json.loads(file.read())
-            holiday = mapper.map_holiday_mode(json_raw)
-            self.assertEqual(False, holiday.is_active)
+        json_raw = load_response("holiday_mode")
+        holiday = mapper.map_holiday_mode(json_raw)
+        self.assertEqual(False, holiday.is_active)
 
     def test_map_zones(self) -> None:
-        with open(path("files/responses/zones"), "r") as file:
-            json_raw = json.loads(file.read())
-            zones = mapper.map_zones(json_raw)
-            self.assertEqual(2, len(zones))
+        json_raw = load_response("zones")
+        zones = mapper.map_zones(json_raw)
+        self.assertEqual(2, len(zones))
 
     def test_map_zones_3_zones(self) -> None:
-        with open(path("files/responses/zones_3_zones"), "r") as file:
-            json_raw = json.loads(file.read())
-            zones = mapper.map_zones(json_raw)
-            self.assertEqual(3, len(zones))
+        json_raw = load_response("zones_3_zones")
+        zones = mapper.map_zones(json_raw)
+        self.assertEqual(3, len(zones))
 
     def test_map_zones_quick_veto_no_heating_config(self) -> None:
-        with open(path("files/responses/zones_missing_heating_config_quick_veto"), "r") as file:
-            json_raw = json.loads(file.read())
-            zones = mapper.map_zones(json_raw)
-            self.assertEqual(3, len(zones))
+        json_raw = load_response("zones_missing_heating_config_quick_veto")
+        zones = mapper.map_zones(json_raw)
+        self.assertEqual(3, len(zones))
 
     def test_map_dhw(self) -> None:
-        with open(path("files/responses/dhws"), "r") as file:
-            raw_dhw = json.loads(file.read())
-            dhw = mapper.map_dhw(raw_dhw)
-            self.assertIsNotNone(dhw.hotwater)
-            self.assertIsNone(dhw.hotwater.temperature)
-            self.assertIsNotNone(dhw.circulation)
+        raw_dhw = load_response("dhws")
+        dhw = mapper.map_dhw(raw_dhw)
+        self.assertIsNotNone(dhw.hotwater)
+        self.assertIsNone(dhw.hotwater.temperature)
+        self.assertIsNotNone(dhw.circulation)
 
     def test_map_dhw_no_timeprogram(self) -> None:
-        with open(path("files/responses/dhws_minimal"), "r") as file:
-            raw_dhw = json.loads(file.read())
-            dhw = mapper.map_dhw(raw_dhw)
-            self.assertIsNotNone(dhw.hotwater)
-            self.assertIsNotNone(dhw.circulation)
-            self.assertIsNotNone(dhw.circulation.time_program)
-            self.assertIsNotNone(dhw.hotwater.time_program)
+        raw_dhw = load_response("dhws_minimal")
+        dhw = mapper.map_dhw(raw_dhw)
+        self.assertIsNotNone(dhw.hotwater)
+        self.assertIsNotNone(dhw.circulation)
+        self.assertIsNotNone(dhw.circulation.time_program)
+        self.assertIsNotNone(dhw.hotwater.time_program)
 
     def test_map_dhw_empty_timeprogram(self) -> None:
-        with open(path("files/responses/dhws_empty_timprogram"), "r") as file:
-            raw_dhw = json.loads(file.read())
-            dhw = mapper.map_dhw(raw_dhw)
-            self.assertIsNotNone(dhw.hotwater)
-            self.assertIsNotNone(dhw.circulation)
-            self.assertIsNotNone(dhw.circulation.time_program)
-            self.assertIsNotNone(dhw.hotwater.time_program)
+        raw_dhw = load_response("dhws_empty_timprogram")
+        dhw = mapper.map_dhw(raw_dhw)
+        self.assertIsNotNone(dhw.hotwater)
+        self.assertIsNotNone(dhw.circulation)
+        self.assertIsNotNone(dhw.circulation.time_program)
+        self.assertIsNotNone(dhw.hotwater.time_program)
 
     def test_map_zone_cooling(self) -> None:
         """Test map zone with cooling."""
-        with open(path("files/responses/systemcontrol_ventilation"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol_ventilation")
         zones = mapper.map_zones_from_system(system)
         self.assertIsNotNone(zones)
 
@@ -88,32 +79,28 @@ class MapperTest(unittest.TestCase):
 
     def test_map_zone_no_active_function(self) -> None:
         """Test map a zone without active function"""
-        with open(path("files/responses/zone_no_active_function"), "r") as file:
-            zone_file = json.loads(file.read())
+        zone_file = load_response("zone_no_active_function")
 
         zone = mapper.map_zone(zone_file)
         self.assertEqual(ActiveFunction.STANDBY, zone.active_function)
 
     def test_map_quick_mode_from_system(self) -> None:
         """Test map quick mode."""
-        with open(path("files/responses/systemcontrol_hotwater_boost"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol_hotwater_boost")
 
         quick_mode = mapper.map_quick_mode_from_system(system)
         self.assertEqual(QuickModes.HOTWATER_BOOST.name, quick_mode.name)
 
     def test_map_quick_mode_quick_veto(self) -> None:
         """Test map quick veto."""
-        with open(path("files/responses/systemcontrol_quick_veto"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol_quick_veto")
 
         quick_mode = mapper.map_quick_mode_from_system(system)
         self.assertIsNone(quick_mode)
 
     def test_map_quick_veto_zone(self) -> None:
         """Test map quick veto zone."""
-        with open(path("files/responses/systemcontrol_quick_veto"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol_quick_veto")
 
         zones = mapper.map_zones_from_system(system)
 
@@ -127,24 +114,21 @@ class MapperTest(unittest.TestCase):
 
     def test_map_no_quick_mode(self) -> None:
         """Test map no quick mode."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol")
 
         quick_mode = mapper.map_quick_mode_from_system(system)
         self.assertIsNone(quick_mode)
 
     def test_map_outdoor_temp(self) -> None:
         """Test map outdoor temperature."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol")
 
         temp = mapper.map_outdoor_temp_from_system(system)
         self.assertEqual(6.3, temp)
 
     def test_map_no_outdoor_temp(self) -> None:
         """Test map no outdoor temperature."""
-        with open(path("files/responses/systemcontrol_no_outside_temp"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol_no_outside_temp")
 
         temp = mapper.map_outdoor_temp_from_system(system)
         self.assertIsNone(temp)
@@ -163,8 +147,7 @@ class MapperTest(unittest.TestCase):
 
     def test_rooms_correct(self) -> None:
         """Test map rooms."""
-        with open(path("files/responses/rooms"), "r") as file:
-            raw_rooms = json.loads(file.read())
+        raw_rooms = load_response("rooms")
 
         rooms = mapper.map_rooms(raw_rooms)
         self.assertIsNotNone(rooms)
@@ -188,8 +171,7 @@ class MapperTest(unittest.TestCase):
 
     def test_room_quick_veto(self) -> None:
         """Test map quick veto room."""
-        with open(path("files/responses/rooms_quick_veto"), "r") as file:
-            raw_rooms = json.loads(file.read())
+        raw_rooms = load_response("rooms_quick_veto")
 
         rooms = mapper.map_rooms(raw_rooms)
         self.assertIsNotNone(rooms)
@@ -209,8 +191,7 @@ class MapperTest(unittest.TestCase):
 
     def test_map_devices(self) -> None:
         """Test map devices."""
-        with open(path("files/responses/rooms"), "r") as file:
-            raw_rooms = json.loads(file.read())
+        raw_rooms = load_response("rooms")
 
         rooms = mapper.map_rooms(raw_rooms)
         self.assertIsNotNone(rooms)
@@ -244,8 +225,7 @@ class MapperTest(unittest.TestCase):
 
     def test_map_devices_no_name(self) -> None:
         """Test map devices."""
-        with open(path("files/responses/room_empty_device_name"), "r") as file:
-            raw_room = json.loads(file.read())
+        raw_room = load_response("room_empty_device_name")
 
         room = mapper.map_room(raw_room)
         self.assertIsNotNone(room)
@@ -256,8 +236,7 @@ class MapperTest(unittest.TestCase):
 
     def test_holiday_mode_none(self) -> None:
         """Test map no holiday mode."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            raw_system = json.loads(file.read())
+        raw_system = load_response("systemcontrol")
 
         holiday_mode = mapper.map_holiday_mode_from_system(raw_system)
         self.assertIsNotNone(holiday_mode)
@@ -270,8 +249,7 @@ class MapperTest(unittest.TestCase):
 
     def test_holiday_mode(self) -> None:
         """Test map holiday mode."""
-        with open(path("files/responses/systemcontrol_holiday"), "r") as file:
-            raw_system = json.loads(file.read())
+        raw_system = load_response("systemcontrol_holiday")
 
         holiday_mode = mapper.map_holiday_mode_from_system(raw_system)
         quick_mode = mapper.map_quick_mode_from_system(raw_system)
@@ -284,8 +262,7 @@ class MapperTest(unittest.TestCase):
 
     def test_map_circulation(self) -> None:
         """Test map circulation."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            raw_system = json.loads(file.read())
+        raw_system = load_response("systemcontrol")
 
         circulation = mapper.map_circulation_from_system(raw_system)
         self.assertEqual(OperatingModes.AUTO, circulation.operating_mode)
@@ -297,10 +274,8 @@ class MapperTest(unittest.TestCase):
 
     def test_hot_water(self) -> None:
         """Test map hot water."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            raw_system = json.loads(file.read())
-        with open(path("files/responses/livereport"), "r") as file:
-            raw_livereport = json.loads(file.read())
+        raw_system = load_response("systemcontrol")
+        raw_livereport = load_response("livereport")
 
         hot_water = mapper.map_hot_water_from_system(raw_system, raw_livereport)
         self.assertEqual(44.5, hot_water.temperature)
@@ -311,9 +286,7 @@ class MapperTest(unittest.TestCase):
 
     def test_no_hotwater(self) -> None:
         """Test map no hot water."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            raw_system = json.loads(file.read())
-
+        raw_system = copy.deepcopy(load_response("systemcontrol"))
         raw_system["body"]["dhw"] = []
 
         hot_water = mapper.map_hot_water_from_system(raw_system, {})
@@ -321,8 +294,7 @@ class MapperTest(unittest.TestCase):
 
     def test_hot_water_no_current_temp(self) -> None:
         """Test map hot water no live report."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            raw_system = json.loads(file.read())
+        raw_system = load_response("systemcontrol")
 
         hot_water = mapper.map_hot_water_from_system(raw_system, json.loads("{}"))
         self.assertEqual(None, hot_water.temperature)
@@ -332,8 +304,7 @@ class MapperTest(unittest.TestCase):
 
     def test_boiler_status(self) -> None:
         """Test map boiler status."""
-        with open(path("files/responses/hvacstate"), "r") as file:
-            hvac = json.loads(file.read())
+        hvac = load_response("hvacstate")
 
         hvac_status = mapper.map_hvac_status(hvac)
         boiler_status = hvac_status.boiler_status
@@ -350,8 +321,7 @@ class MapperTest(unittest.TestCase):
 
     def test_boiler_status_no_live_report(self) -> None:
         """Test map boiler status no live report."""
-        with open(path("files/responses/hvacstate"), "r") as file:
-            hvac = json.loads(file.read())
+        hvac = load_response("hvacstate")
 
         hvac_status = mapper.map_hvac_status(hvac)
         self.assertEqual("...", hvac_status.boiler_status.hint)
@@ -370,16 +340,14 @@ class MapperTest(unittest.TestCase):
 
     def test_boiler_status_empty(self) -> None:
         """Test map empty boiler status."""
-        with open(path("files/responses/hvacstate_empty"), "r") as file:
-            hvac = json.loads(file.read())
+        hvac = load_response("hvacstate_empty")
 
         hvac_status = mapper.map_hvac_status(hvac)
         self.assertIsNone(hvac_status.boiler_status)
 
     def test_hot_water_alone(self) -> None:
         """Test map hot water."""
-        with open(path("files/responses/hotwater"), "r") as file:
-            raw_hotwater = json.loads(file.read())
+        raw_hotwater = load_response("hotwater")
 
         hotwater = mapper.map_hot_water(raw_hotwater, "control_dhw")
         self.assertEqual("control_dhw", hotwater.id)
@@ -393,8 +361,7 @@ class MapperTest(unittest.TestCase):
 
     def test_circulation_alone(self) -> None:
         """Test map circulation."""
-        with open(path("files/responses/circulation"), "r") as file:
-            raw_circulation = json.loads(file.read())
+        raw_circulation = load_response("circulation")
 
         circulation = mapper.map_circulation_alone(raw_circulation, "control_dhw")
         self.assertEqual("control_dhw", circulation.id)
@@ -409,9 +376,7 @@ class MapperTest(unittest.TestCase):
 
     def test_no_circulation(self) -> None:
         """Test map no circulation."""
-        with open(path("files/responses/systemcontrol"), "r") as file:
-            raw_system = json.loads(file.read())
-
+        raw_system = copy.deepcopy(load_response("systemcontrol"))
         raw_system["body"]["dhw"] = []
 
         circulation = mapper.map_circulation_from_system(raw_system)
@@ -419,16 +384,14 @@ class MapperTest(unittest.TestCase):
 
     def test_errors_no_error(self) -> None:
         """Test map no errors."""
-        with open(path("files/responses/hvacstate"), "r") as file:
-            raw_hvac = json.loads(file.read())
+        raw_hvac = load_response("hvacstate")
 
         errors = mapper.map_errors(raw_hvac)
         self.assertEqual(0, len(errors))
 
     def test_errors_with_errors(self) -> None:
         """Test map hvac errors."""
-        with open(path("files/responses/hvacstate_errors"), "r") as file:
-            raw_hvac = json.loads(file.read())
+        raw_hvac = load_response("hvacstate_errors")
 
         errors = mapper.map_errors(raw_hvac)
         self.assertEqual(1, len(errors))
@@ -439,8 +402,7 @@ class MapperTest(unittest.TestCase):
         self.assertEqual("F.900", errors[0].status_code)
 
     def test_map_facility_detail(self) -> None:
-        with open(path("files/responses/facilities"), "r") as file:
-            facilities = json.loads(file.read())
+        facilities = load_response("facilities")
 
         sys_info = mapper.map_facility_detail(facilities)
         self.assertEqual("1234567890123456789012345678", sys_info.serial_number)
@@ -449,8 +411,7 @@ class MapperTest(unittest.TestCase):
         self.assertEqual("1.2.3", sys_info.firmware_version)
 
     def test_map_system_info_specific_serial(self) -> None:
-        with open(path("files/responses/facilities_multiple"), "r") as file:
-            facilities = json.loads(file.read())
+        facilities = load_response("facilities_multiple")
 
         sys_info = mapper.map_facility_detail(facilities, "888")
         self.assertEqual("888", sys_info.serial_number)
@@ -461,8 +422,7 @@ class MapperTest(unittest.TestCase):
         self.assertIsNone(mapper.map_hvac_sync_state(None))
 
     def test_map_reports(self) -> None:
-        with open(path("files/responses/livereport"), "r") as file:
-            livereport = json.loads(file.read())
+        livereport = load_response("livereport")
         reports = mapper.map_reports(livereport)
         self.assertEqual(5, len(reports))
         self.assertEqual("VRC700 MultiMatic", reports[0].device_name)
@@ -477,8 +437,7 @@ class MapperTest(unittest.TestCase):
         self.assertEqual(0, len(reports))
 
     def test_map_ventilation(self) -> None:
-        with open(path("files/responses/systemcontrol_ventilation"), "r") as file:
-            system = json.loads(file.read())
+        system = load_response("systemcontrol_ventilation")
 
         ventilation = mapper.map_ventilation_from_system(system)
         self.assertIsNotNone(ventilation)
@@ -490,23 +449,20 @@ class MapperTest(unittest.TestCase):
         self.assertIsNone(ventilation.temperature)
 
     def test_map_zone_quickveto(self) -> None:
-        with open(path("files/responses/zone_no_quickveto"), "r") as file:
-            raw_zone = json.loads(file.read())
-            zone = mapper.map_zone(raw_zone)
-            self.assertIsNotNone(zone)
-            self.assertIsNone(zone.quick_veto)
+        raw_zone = load_response("zone_no_quickveto")
+        zone = mapper.map_zone(raw_zone)
+        self.assertIsNotNone(zone)
+        self.assertIsNone(zone.quick_veto)
 
     def test_map_system_no_config_rbr(self) -> None:
-        with open(path("files/responses/systemcontrol_zone_no_config_rbr"), "r") as file:
-            raw_system = json.loads(file.read())
-            zones = mapper.map_zones_from_system(raw_system)
-            self.assertIsNotNone(zones)
-            self.assertIsNotNone(zones[0])
-            self.assertIsNotNone(zones[1])
+        raw_system = load_response("systemcontrol_zone_no_config_rbr")
+        zones = mapper.map_zones_from_system(raw_system)
+        self.assertIsNotNone(zones)
+        self.assertIsNotNone(zones[0])
+        self.assertIsNotNone(zones[1])
 
     def test_map_emf_reports(self) -> None:
-        with open(path("files/responses/emf_devices"), "r") as file:
-            raw_emf_reports = json.loads(file.read())
+        raw_emf_reports = load_response("emf_devices")
         reports = mapper.map_emf_reports(raw_emf_reports)
         self.assertEqual(7, len(reports))
         self.assertEqual("VWF 117/4", reports[1].device_name)
@@ -1,11 +1,10 @@
 """Tests schema."""
-import json
 import unittest
 
 from schema import SchemaError
 
 from pymultimatic.api import schemas
-from tests.conftest import path
+from tests.conftest import parse_response
 
 
 class SchemaTest(unittest.TestCase):
@@ -13,8 +12,6 @@ class SchemaTest(unittest.TestCase):
 
     def test_schema_system_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = [
             "systemcontrol",
             "systemcontrol_holiday",
@@ -27,50 +24,42 @@ class SchemaTest(unittest.TestCase):
         ]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.SYSTEM.validate(json_val)
-                json_val.pop("meta")
-                json_val.get("body").pop("parameters")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.SYSTEM.validate(json_val)
+            json_val.pop("meta")
+            json_val.get("body").pop("parameters")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_system_validation_error(self) -> None:
         """Ensure validation fails."""
-        with open(path("files/responses/systemcontrol_zone_no_config"), "r") as open_f:
-            json_val = json.loads(open_f.read())
-            try:
-                schemas.SYSTEM.validate(json_val)
-            except SchemaError as err:
-                self.assertIn("Missing key: 'configuration'", err.args[0])
+        json_val = parse_response("systemcontrol_zone_no_config")
+        try:
+            schemas.SYSTEM.validate(json_val)
+        except SchemaError as err:
+            self.assertIn("Missing key: 'configuration'", err.args[0])
 
     def test_schema_livereport_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
         files = ["livereport", "livereport_FlowTemperatureVF1"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.LIVE_REPORTS.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.LIVE_REPORTS.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_livereport_single_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
         files = ["livereport_single"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.LIVE_REPORT.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.LIVE_REPORT.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_hvac_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = [
             "hvacstate",
             "hvacstate_empty",
@@ -79,29 +68,23 @@ class SchemaTest(unittest.TestCase):
         ]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.HVAC.validate(json_val)
-                json_val.get("meta").pop("syncState")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.HVAC.validate(json_val)
+            json_val.get("meta").pop("syncState")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_facilities_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = ["facilities", "facilities_multiple"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.FACILITIES.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.FACILITIES.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_zone_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = [
             "zone",
             "zone_always_off",
@@ -111,72 +94,57 @@ class SchemaTest(unittest.TestCase):
         ]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.ZONE.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.ZONE.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_zones_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = ["zones", "zones_3_zones", "zones_missing_heating_config_quick_veto"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.ZONE_LIST.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.ZONE_LIST.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_rooms_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = ["rooms", "rooms_quick_veto"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.ROOM_LIST.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.ROOM_LIST.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_room_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = ["room", "room_empty_device_name"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.ROOM.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.ROOM.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_dhw_validation(self) -> None:
         """Ensure schema validation doesn't alter the response"""
-        my_path = "files/responses/"
-
         files = ["dhws", "dhws_minimal"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.DHWS.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.DHWS.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
 
     def test_schema_validation(self) -> None:
         """Ensure validation works"""
-        my_path = "files/responses/"
         files = ["hotwater", "hotwater_always_off", "hotwater_always_on"]
 
         for file in files:
-            with open(path(my_path + file), "r") as open_f:
-                json_val = json.loads(open_f.read())
-                result = schemas.HOT_WATER.validate(json_val)
-                json_val.pop("meta")
-                self.assertDictEqual(result, json_val, "error for " + file)
+            json_val = parse_response(file)
+            result = schemas.HOT_WATER.validate(json_val)
+            json_val.pop("meta")
+            self.assertDictEqual(result, json_val, "error for " + file)
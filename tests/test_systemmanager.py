@@ -1,6 +1,10 @@
+from __future__ import annotations
+
+import asyncio
+import copy
 import json
 from datetime import date, timedelta
-from typing import Any, AsyncGenerator, Dict, List, Tuple, Type
+from typing import Any, AsyncGenerator, Callable, Optional
 from unittest import mock
 
 import pytest
@@ -10,59 +14,74 @@ from aioresponses import aioresponses
 from pymultimatic.api import ApiError, Connector, WrongResponseError, payloads, urls
 from pymultimatic.model import OperatingModes, QuickModes, QuickVeto, constants, mapper
 from pymultimatic.systemmanager import SystemManager, retry_async
-from tests.conftest import mock_auth, path
-
-SERIAL = mapper.map_serial_number(json.loads(open(path("files/responses/facilities")).read()))
+from tests.conftest import load_response, mock_auth, mock_connector
+
+SERIAL = mapper.map_serial_number(load_response("facilities"))
+
+_URL_FACILITIES = urls.facilities_list()
+_URL_GATEWAY = urls.gateway_type(serial=SERIAL)
+_URL_HOLIDAY_MODE = urls.system_holiday_mode(serial=SERIAL)
+_URL_HOT_WATER_SETPOINT = urls.hot_water_temperature_setpoint(id="id", serial=SERIAL)
+_URL_HVAC = urls.hvac(serial=SERIAL)
+_URL_HVAC_UPDATE = urls.hvac_update(serial=SERIAL)
+_URL_LIVE_REPORT = urls.live_report(serial=SERIAL)
+_URL_QUICK_MODE = urls.system_quickmode(serial=SERIAL)
+_URL_ROOM_QUICK_VETO = urls.room_quick_veto(id="1", serial=SERIAL)
+_URL_ROOMS = urls.rooms(serial=SERIAL)
+_URL_SYSTEM = urls.system(serial=SERIAL)
+_URL_ZONE = urls.zone(id="zone", serial=SERIAL)
+
+_SYSTEM_MOCKS = [
+    (_URL_LIVE_REPORT, "livereport"),
+    (_URL_ROOMS, "rooms"),
+    (_URL_SYSTEM, "systemcontrol"),
+    (_URL_HVAC, "hvacstate"),
+    (_URL_FACILITIES, "facilities"),
+    (_URL_GATEWAY, "gateway"),
+]
 
 
 @pytest.fixture(name="resp", autouse=True)
-async def fixture_resp(resp: aioresponses) -> AsyncGenerator[aioresponses, None]:
-    with open(path("files/responses/facilities"), "r") as file:
-        facilities = json.loads(file.read())
-        resp.get(urls.facilities_list(), payload=facilities, status=200)
+async def fixture_resp(
+    request: pytest.FixtureRequest, resp: aioresponses
+) -> AsyncGenerator[aioresponses, None]:
+    if not request.node.get_closest_marker("no_facilities"):
+        resp.get(_URL_FACILITIES, payload=load_response("facilities"), status=200)
     yield resp
 
 
-@pytest.fixture(name="manager")
-async def fixture_manager(
-    session: ClientSession, connector: Connector
+@pytest.fixture(name="logged_in_manager", scope="module")
+async def fixture_logged_in_manager(
+    shared_resp: aioresponses,
 ) -> AsyncGenerator[SystemManager, None]:
-    manager = SystemManager("user", "pass", session, "pymultiMATIC", SERIAL)
-    await connector.login()
-    with mock.patch.object(connector, "request", wraps=connector.request):
-        manager._connector = connector
+    async with ClientSession() as session:
+        manager = SystemManager("user", "pass", session, "pymultiMATIC", SERIAL)
+        manager._connector = mock_connector(session)
+        mock_auth(shared_resp)
+        await manager._connector.login()
+        mocked_request = mock.MagicMock(wraps=manager._connector.request)
+        setattr(manager._connector, "request", mocked_request)
         yield manager
 
 
-@pytest.mark.asyncio
-async def test_system(manager: SystemManager, resp: aioresponses) -> None:
-    with open(path("files/responses/livereport"), "r") as file:
-        livereport_data = json.loads(file.read())
-
-    with open(path("files/responses/rooms"), "r") as file:
-        rooms_data = json.loads(file.read())
-
-    with open(path("files/responses/systemcontrol"), "r") as file:
-        system_data = json.loads(file.read())
+@pytest.fixture(name="manager")
+async def fixture_manager(
+    logged_in_manager: SystemManager, resp: aioresponses
+) -> AsyncGenerator[SystemManager, None]:
+    await logged_in_manager._connector.login()
+    yield logged_in_manager
+    logged_in_manager._connector.request.reset_mock()  # type: ignore
 
-    with open(path("files/responses/hvacstate"), "r") as file:
-        hvacstate_data = json.loads(file.read())
 
-    with open(path("files/responses/facilities"), "r") as file:
-        facilities = json.loads(file.read())
+@pytest.fixture(name="stub_manager")
+def fixture_stub_manager(session: ClientSession) -> SystemManager:
+    manager = SystemManager("user", "pass", session, "pymultiMATIC", SERIAL)
+    manager._connector = mock.MagicMock()
+    return manager
 
-    with open(path("files/responses/gateway"), "r") as file:
-        gateway = json.loads(file.read())
 
-    _mock_urls(
-        resp,
-        hvacstate_data,
-        livereport_data,
-        rooms_data,
-        system_data,
-        facilities,
-        gateway,
-    )
+async def test_system(manager: SystemManager, resp: aioresponses) -> None:
+    _mock_urls(resp)
 
     system = await manager.get_system()
 
@@ -74,322 +93,405 @@ async def test_system(manager: SystemManager, resp: aioresponses) -> None:
     assert manager._fixed_serial
 
 
-@pytest.mark.asyncio
-async def test_get_hot_water(manager: SystemManager, resp: aioresponses) -> None:
-    with open(path("files/responses/hotwater"), "r") as file:
-        raw_hotwater = json.loads(file.read())
-
-    dhw_url = urls.hot_water(id="Control_DHW", serial=SERIAL)
-    resp.get(dhw_url, payload=raw_hotwater, status=200)
-
-    hot_water = await manager.get_hot_water("Control_DHW")
-
-    assert hot_water is not None
-    _assert_calls(1, manager, [dhw_url])
-
-
-@pytest.mark.asyncio
-async def test_set_hot_water_setpoint_temperature(
-    manager: SystemManager, resp: aioresponses
+_GET_CASES = [
+    pytest.param(
+        "get_hot_water",
+        ("Control_DHW",),
+        "hotwater",
+        urls.hot_water(id="Control_DHW", serial=SERIAL),
+        lambda hot_water: hot_water is not None,
+        id="hot_water",
+    ),
+    pytest.param(
+        "get_room",
+        ("1",),
+        "room",
+        urls.room(id="1", serial=SERIAL),
+        lambda room: room is not None,
+        id="room",
+    ),
+    pytest.param(
+        "get_zone",
+        ("Control_ZO2",),
+        "zone",
+        urls.zone(id="Control_ZO2", serial=SERIAL),
+        lambda zone: zone is not None,
+        id="zone",
+    ),
+    pytest.param(
+        "get_circulation",
+        ("id_dhw",),
+        "circulation",
+        urls.circulation(id="id_dhw", serial=SERIAL),
+        lambda circulation: circulation is not None,
+        id="circulation",
+    ),
+    pytest.param(
+        "get_gateway",
+        (),
+        "gateway",
+        _URL_GATEWAY,
+        lambda gateway: gateway == "VR920",
+        id="gateway",
+    ),
+    pytest.param(
+        "get_quick_mode",
+        (),
+        "quick_mode",
+        _URL_QUICK_MODE,
+        lambda quickmode: quickmode == QuickModes.SYSTEM_OFF,
+        id="quickmode",
+    ),
+    pytest.param(
+        "get_outdoor_temperature",
+        (),
+        "systemstatus",
+        urls.system_status(serial=SERIAL),
+        lambda temp: temp == 12.5,
+        id="outdoor_temperature",
+    ),
+    pytest.param(
+        "get_hvac_status",
+        (),
+        "hvacstate",
+        _URL_HVAC,
+        lambda hvac_status: hvac_status is not None,
+        id="hvac_status",
+    ),
+    pytest.param(
+        "get_facility_detail",
+        (),
+        "facilities",
+        _URL_FACILITIES,
+        lambda details: details.serial_number == SERIAL,
+        id="facility_detail_no_serial",
+    ),
+    pytest.param(
+        "get_live_reports",
+        (),
+        "livereport",
+        _URL_LIVE_REPORT,
+        lambda reports: reports is not None and len(reports) > 0,
+        id="live_reports",
+    ),
+    pytest.param(
+        "get_live_report",
+        ("1", "2"),
+        "livereport_single",
+        urls.live_report_device(serial=SERIAL, report_id="1", device_id="2"),
+        lambda report: report is not None,
+        id="live_report",
+    ),
+    pytest.param(
+        "get_holiday_mode",
+        (),
+        "holiday_mode",
+        _URL_HOLIDAY_MODE,
+        lambda holiday_mode: holiday_mode is not None,
+        id="holiday_mode",
+    ),
+    pytest.param(
+        "get_rooms",
+        (),
+        "rooms",
+        _URL_ROOMS,
+        lambda rooms: rooms is not None and len(rooms) > 0,
+        id="rooms",
+    ),
+    pytest.param(
+        "get_dhw",
+        (),
+        "dhws",
+        urls.dhws(serial=SERIAL),
+        lambda dhw: dhw.hotwater is not None and dhw.circulation is not None,
+        id="dhw",
+    ),
+    pytest.param(
+        "get_zones",
+        (),
+        "zones",
+        urls.zones(serial=SERIAL),
+        lambda zones: zones is not None and len(zones) > 0,
+        id="zones",
+    ),
+    pytest.param(
+        "get_ventilation",
+        (),
+        "ventilation",
+        urls.system_ventilation(serial=SERIAL),
+        lambda ventilation: ventilation is not None,
+        id="ventilation",
+    ),
+    pytest.param(
+        "get_emf_devices",
+        (),
+        "emf_devices",
+        urls.emf_devices(serial=SERIAL),
+        lambda emf_reports: emf_reports is not None and len(emf_reports) == 7,
+        id="emf_devices",
+    ),
+]
+
+
+@pytest.mark.parametrize("method, args, fixture, url, check", _GET_CASES)
+async def test_get_endpoint(
+    manager: SystemManager,
+    resp: aioresponses,
+    method: str,
+    args: tuple[Any, ...],
+    fixture: str,
+    url: str,
+    check: Callable[[Any], bool],
 ) -> None:
-    url = urls.hot_water_temperature_setpoint(id="id", serial=SERIAL)
-    payload = payloads.hotwater_temperature_setpoint(60.0)
-
-    resp.put(url, status=200)
+    resp.get(url, payload=load_response(fixture), status=200)
 
-    await manager.set_hot_water_setpoint_temperature("id", 60)
-
-    _assert_calls(1, manager, [url], [payload])
+    result = await getattr(manager, method)(*args)
+    assert check(result)
+    _assert_calls(1, manager, [url])
 
 
-@pytest.mark.asyncio
-async def test_set_hot_water_setpoint_temp_number_to_round(
-    manager: SystemManager, resp: aioresponses
+_PUT_CASES = [
+    pytest.param(
+        "set_hot_water_setpoint_temperature",
+        ("id", 60),
+        _URL_HOT_WATER_SETPOINT,
+        payloads.hotwater_temperature_setpoint(60.0),
+        id="hot_water_setpoint_temperature",
+    ),
+    pytest.param(
+        "set_hot_water_setpoint_temperature",
+        ("id", 60.4),
+        _URL_HOT_WATER_SETPOINT,
+        payloads.hotwater_temperature_setpoint(60.5),
+        id="hot_water_setpoint_temp_number_to_round",
+    ),
+    pytest.param(
+        "set_quick_mode",
+        (QuickModes.VENTILATION_BOOST,),
+        _URL_QUICK_MODE,
+        payloads.quickmode(QuickModes.VENTILATION_BOOST.name),
+        id="quick_mode_no_current_quick_mode",
+    ),
+    pytest.param(
+        "set_room_quick_veto",
+        ("1", QuickVeto(100, 25)),
+        _URL_ROOM_QUICK_VETO,
+        None,
+        id="quick_veto_room",
+    ),
+    pytest.param(
+        "set_hot_water_operating_mode",
+        ("hotwater", OperatingModes.ON),
+        urls.hot_water_operating_mode(id="hotwater", serial=SERIAL),
+        None,
+        id="hot_water_operation_mode_heating_mode",
+    ),
+    pytest.param(
+        "set_zone_quick_veto",
+        ("Zone1", QuickVeto(duration=100, target=25)),
+        urls.zone_quick_veto(id="Zone1", serial=SERIAL),
+        None,
+        id="quick_veto_zone",
+    ),
+    pytest.param(
+        "set_room_operating_mode",
+        ("1", OperatingModes.AUTO),
+        urls.room_operating_mode(id="1", serial=SERIAL),
+        None,
+        id="room_operation_mode_heating_mode",
+    ),
+    pytest.param(
+        "set_zone_heating_operating_mode",
+        ("Zone1", OperatingModes.AUTO),
+        urls.zone_heating_mode(id="Zone1", serial=SERIAL),
+        None,
+        id="zone_operation_mode_heating_mode",
+    ),
+    pytest.param(
+        "set_room_setpoint_temperature",
+        ("1", 22),
+        urls.room_temperature_setpoint(id="1", serial=SERIAL),
+        payloads.room_temperature_setpoint(22.0),
+        id="room_setpoint_temperature",
+    ),
+    pytest.param(
+        "set_zone_heating_setpoint_temperature",
+        ("Zone1", 25.5),
+        urls.zone_heating_setpoint_temperature(id="Zone1", serial=SERIAL),
+        payloads.zone_temperature_setpoint(25.5),
+        id="zone_setpoint_temperature",
+    ),
+    pytest.param(
+        "set_zone_heating_setback_temperature",
+        ("Zone1", 18),
+        urls.zone_heating_setback_temperature(id="Zone1", serial=SERIAL),
+        payloads.zone_temperature_setback(18.0),
+        id="zone_setback_temperature",
+    ),
+    pytest.param(
+        "set_room_quick_veto",
+        ("0", QuickVeto(180, 22.7)),
+        urls.room_quick_veto(id="0", serial=SERIAL),
+        payloads.room_quick_veto(22.5, 180),
+        id="quick_veto_temperature_room_rounded",
+    ),
+    pytest.param(
+        "set_zone_quick_veto",
+        ("zone1", QuickVeto(duration=35, target=22.7)),
+        urls.zone_quick_veto(id="zone1", serial=SERIAL),
+        payloads.zone_quick_veto(22.5),
+        id="quick_veto_temperature_zone_rounded",
+    ),
+    pytest.param(
+        "set_ventilation_operating_mode",
+        ("123", OperatingModes.OFF),
+        urls.set_ventilation_operating_mode(id="123", serial=SERIAL),
+        payloads.ventilation_operating_mode("OFF"),
+        id="ventilation_operating_mode",
+    ),
+]
+
+
+@pytest.mark.parametrize("method, args, url, payload", _PUT_CASES)
+async def test_put_endpoint(
+    manager: SystemManager,
+    resp: aioresponses,
+    method: str,
+    args: tuple[Any, ...],
+    url: str,
+    payload: Optional[dict[str, Any]],
 ) -> None:
-    url = urls.hot_water_temperature_setpoint(serial=SERIAL, id="id")
-    payload = payloads.hotwater_temperature_setpoint(60.5)
-
     resp.put(url, status=200)
 
-    await manager.set_hot_water_setpoint_temperature("id", 60.4)
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
-async def test_set_quick_mode_no_current_quick_mode(
-    manager: SystemManager, resp: aioresponses
+    await getattr(manager, method)(*args)
+    _assert_calls(1, manager, [url], [payload] if payload else None)
+
+
+_DELETE_CASES = [
+    pytest.param(
+        "remove_zone_quick_veto",
+        ("id",),
+        urls.zone_quick_veto(id="id", serial=SERIAL),
+        id="zone_quick_veto",
+    ),
+    pytest.param(
+        "remove_room_quick_veto",
+        ("1",),
+        _URL_ROOM_QUICK_VETO,
+        id="room_quick_veto",
+    ),
+    pytest.param(
+        "remove_quick_mode",
+        (),
+        _URL_QUICK_MODE,
+        id="quick_mode",
+    ),
+]
+
+
+@pytest.mark.parametrize("method, args, url", _DELETE_CASES)
+async def test_delete_endpoint(
+    manager: SystemManager,
+    resp: aioresponses,
+    method: str,
+    args: tuple[Any, ...],
+    url: str,
 ) -> None:
-    url = urls.system_quickmode(serial=SERIAL)
-    payload = payloads.quickmode(QuickModes.VENTILATION_BOOST.name)
-
-    resp.put(url, status=200)
+    resp.delete(url, status=200)
 
-    await manager.set_quick_mode(QuickModes.VENTILATION_BOOST)
-    _assert_calls(1, manager, [url], [payload])
+    await getattr(manager, method)(*args)
+    _assert_calls(1, manager, [url])
 
 
-@pytest.mark.asyncio
 async def test_logout(manager: SystemManager) -> None:
     await manager.logout()
     _assert_calls(1, manager, [urls.logout()])
 
 
-@pytest.mark.asyncio
-async def test_set_quick_veto_room(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.room_quick_veto(serial=SERIAL, id="1")
+async def test_set_hot_water_operation_mode_wrong_mode(stub_manager: SystemManager) -> None:
+    await stub_manager.set_hot_water_operating_mode("hotwater", OperatingModes.NIGHT)
 
-    quick_veto = QuickVeto(100, 25)
-    resp.put(url, status=200)
-
-    await manager.set_room_quick_veto("1", quick_veto)
-    _assert_calls(1, manager, [url])
+    _assert_calls(0, stub_manager)
 
 
-@pytest.mark.asyncio
-async def test_set_hot_water_operation_mode_wrong_mode(manager: SystemManager) -> None:
-    await manager.set_hot_water_operating_mode("hotwater", OperatingModes.NIGHT)
+async def test_set_room_operation_mode_no_new_mode(stub_manager: SystemManager) -> None:
+    await stub_manager.set_room_operating_mode("1", None)
+    _assert_calls(0, stub_manager)
 
-    _assert_calls(0, manager)
 
+async def test_set_room_operation_mode_wrong_mode(stub_manager: SystemManager) -> None:
+    await stub_manager.set_room_operating_mode("1", OperatingModes.NIGHT)
+    _assert_calls(0, stub_manager)
 
-@pytest.mark.asyncio
-async def test_set_hot_water_operation_mode_heating_mode(
-    manager: SystemManager, resp: aioresponses
-) -> None:
-    url = urls.hot_water_operating_mode(serial=SERIAL, id="hotwater")
 
-    resp.put(url, status=200)
-    await manager.set_hot_water_operating_mode("hotwater", OperatingModes.ON)
-    _assert_calls(1, manager, [url])
+async def test_set_zone_operation_mode_no_new_mode(stub_manager: SystemManager) -> None:
+    await stub_manager.set_zone_heating_operating_mode("Zone1", None)
+    _assert_calls(0, stub_manager)
 
 
-@pytest.mark.asyncio
-async def test_set_quick_veto_zone(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.zone_quick_veto(id="Zone1", serial=SERIAL)
+async def test_set_zone_operation_mode_no_zone(stub_manager: SystemManager) -> None:
+    await stub_manager.set_zone_heating_operating_mode(None, OperatingModes.MANUAL)
+    _assert_calls(0, stub_manager)
 
-    quick_veto = QuickVeto(duration=100, target=25)
-    resp.put(url, status=200)
 
-    await manager.set_zone_quick_veto("Zone1", quick_veto)
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_set_room_operation_mode_heating_mode(
-    manager: SystemManager, resp: aioresponses
-) -> None:
-    url = urls.room_operating_mode(id="1", serial=SERIAL)
-    print(url)
-
-    resp.put(url, status=200)
-    await manager.set_room_operating_mode("1", OperatingModes.AUTO)
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_set_room_operation_mode_no_new_mode(manager: SystemManager) -> None:
-    await manager.set_room_operating_mode("1", None)
-    _assert_calls(0, manager)
-
-
-@pytest.mark.asyncio
-async def test_set_room_operation_mode_wrong_mode(manager: SystemManager) -> None:
-    await manager.set_room_operating_mode("1", OperatingModes.NIGHT)
-
-
-@pytest.mark.asyncio
-async def test_set_zone_operation_mode_heating_mode(
-    manager: SystemManager, resp: aioresponses
-) -> None:
-    url = urls.zone_heating_mode(id="Zone1", serial=SERIAL)
-
-    resp.put(url, status=200)
-    await manager.set_zone_heating_operating_mode("Zone1", OperatingModes.AUTO)
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_set_zone_operation_mode_no_new_mode(manager: SystemManager) -> None:
-    await manager.set_zone_heating_operating_mode("Zone1", None)
-    _assert_calls(0, manager)
-
-
-@pytest.mark.asyncio
-async def test_set_zone_operation_mode_no_zone(manager: SystemManager) -> None:
-    await manager.set_zone_heating_operating_mode(None, OperatingModes.MANUAL)
-    _assert_calls(0, manager)
-
-
-@pytest.mark.asyncio
-async def test_get_room(manager: SystemManager, resp: aioresponses) -> None:
-    with open(path("files/responses/room"), "r") as file:
-        raw_rooms = json.loads(file.read())
-
-    resp.get(urls.room(id="1", serial=SERIAL), payload=raw_rooms, status=200)
-
-    new_room = await manager.get_room("1")
-    assert new_room is not None
-
-
-@pytest.mark.asyncio
-async def test_get_zone(manager: SystemManager, resp: aioresponses) -> None:
-    with open(path("files/responses/zone"), "r") as file:
-        raw_zone = json.loads(file.read())
-
-    url = urls.zone(serial=SERIAL, id="Control_ZO2")
-    resp.get(url, payload=raw_zone, status=200)
-
-    new_zone = await manager.get_zone("Control_ZO2")
-    assert new_zone is not None
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_circulation(manager: SystemManager, resp: aioresponses) -> None:
-    with open(path("files/responses/circulation"), "r") as file:
-        raw_circulation = json.loads(file.read())
-
-    url = urls.circulation(id="id_dhw", serial=SERIAL)
-    resp.get(url, payload=raw_circulation, status=200)
-
-    new_circulation = await manager.get_circulation("id_dhw")
-    assert new_circulation is not None
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_set_room_setpoint_temperature(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.room_temperature_setpoint(id="1", serial=SERIAL)
-    payload = payloads.room_temperature_setpoint(22.0)
-    resp.put(url, status=200)
-
-    await manager.set_room_setpoint_temperature("1", 22)
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
-async def test_set_zone_setpoint_temperature(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.zone_heating_setpoint_temperature(id="Zone1", serial=SERIAL)
-    payload = payloads.zone_temperature_setpoint(25.5)
-
-    resp.put(url, status=200)
-
-    await manager.set_zone_heating_setpoint_temperature("Zone1", 25.5)
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
-async def test_set_zone_setback_temperature(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.zone_heating_setback_temperature(id="Zone1", serial=SERIAL)
-    payload = payloads.zone_temperature_setback(18.0)
-
-    resp.put(url, status=200)
-
-    await manager.set_zone_heating_setback_temperature("Zone1", 18)
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
 async def test_set_holiday_mode(manager: SystemManager, resp: aioresponses) -> None:
     tomorrow = date.today() + timedelta(days=1)
     after_tomorrow = tomorrow + timedelta(days=1)
 
-    url = urls.system_holiday_mode(serial=SERIAL)
-    resp.put(url, status=200)
+    resp.put(_URL_HOLIDAY_MODE, status=200)
     payload = payloads.holiday_mode(True, tomorrow, after_tomorrow, 15.0)
 
     await manager.set_holiday_mode(tomorrow, after_tomorrow, 15)
-    _assert_calls(1, manager, [url], [payload])
+    _assert_calls(1, manager, [_URL_HOLIDAY_MODE], [payload])
 
 
-@pytest.mark.asyncio
 async def test_remove_holiday_mode(manager: SystemManager, resp: aioresponses) -> None:
     yesterday = date.today() - timedelta(days=1)
     before_yesterday = yesterday - timedelta(days=1)
 
-    url = urls.system_holiday_mode(serial=SERIAL)
-    resp.put(url, status=200)
+    resp.put(_URL_HOLIDAY_MODE, status=200)
     payload = payloads.holiday_mode(
         False, before_yesterday, yesterday, constants.FROST_PROTECTION_TEMP
     )
 
     await manager.remove_holiday_mode()
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
-async def test_remove_zone_quick_veto(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.zone_quick_veto(id="id", serial=SERIAL)
-    resp.delete(url, status=200)
-
-    await manager.remove_zone_quick_veto("id")
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_remove_room_quick_veto(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.room_quick_veto(id="1", serial=SERIAL)
-    resp.delete(url, status=200)
-
-    await manager.remove_room_quick_veto("1")
-    _assert_calls(1, manager, [url])
+    _assert_calls(1, manager, [_URL_HOLIDAY_MODE], [payload])
 
 
-@pytest.mark.asyncio
 async def test_request_hvac_update(manager: SystemManager, resp: aioresponses) -> None:
-    url_update = urls.hvac_update(serial=SERIAL)
-    resp.put(url_update, status=200)
+    resp.put(_URL_HVAC_UPDATE, status=200)
 
-    with open(path("files/responses/hvacstate"), "r") as file:
-        hvacstate_data = json.loads(file.read())
+    hvacstate_data = load_response("hvacstate")
 
-    url_hvac = urls.hvac(serial=SERIAL)
-    resp.get(url_hvac, payload=hvacstate_data, status=200)
+    resp.get(_URL_HVAC, payload=hvacstate_data, status=200)
 
     await manager.request_hvac_update()
 
-    _assert_calls(2, manager, [url_hvac, url_update])
+    _assert_calls(2, manager, [_URL_HVAC, _URL_HVAC_UPDATE])
 
 
-@pytest.mark.asyncio
 async def test_request_hvac_not_sync(manager: SystemManager, resp: aioresponses) -> None:
-    url_update = urls.hvac_update(serial=SERIAL)
-    resp.put(url_update, status=200)
+    resp.put(_URL_HVAC_UPDATE, status=200)
 
-    with open(path("files/responses/hvacstate_pending"), "r") as file:
-        hvacstate_data = json.loads(file.read())
+    hvacstate_data = load_response("hvacstate_pending")
 
-    url_hvac = urls.hvac(serial=SERIAL)
-    resp.get(url_hvac, payload=hvacstate_data, status=200)
+    resp.get(_URL_HVAC, payload=hvacstate_data, status=200)
 
     await manager.request_hvac_update()
-    _assert_calls(1, manager, [url_hvac])
+    _assert_calls(1, manager, [_URL_HVAC])
 
 
-@pytest.mark.asyncio
-async def test_remove_quick_mode(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_quickmode(serial=SERIAL)
-    resp.delete(url, status=200)
-
-    await manager.remove_quick_mode()
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
 async def test_remove_quick_mode_no_active_quick_mode(
     manager: SystemManager, resp: aioresponses
 ) -> None:
-    url = urls.system_quickmode(serial=SERIAL)
-    resp.delete(url, status=409)
+    resp.delete(_URL_QUICK_MODE, status=409)
 
     await manager.remove_quick_mode()
-    _assert_calls(1, manager, [url])
+    _assert_calls(1, manager, [_URL_QUICK_MODE])
 
 
-@pytest.mark.asyncio
 async def test_remove_quick_mode_error(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_quickmode(serial=SERIAL)
-    resp.delete(url, status=400)
+    resp.delete(_URL_QUICK_MODE, status=400)
 
     try:
         await manager.remove_quick_mode()
@@ -397,41 +499,11 @@ async def test_remove_quick_mode_error(manager: SystemManager, resp: aioresponse
     except ApiError as exc:
         assert exc.status == 400
 
-    _assert_calls(1, manager, [url])
+    _assert_calls(1, manager, [_URL_QUICK_MODE])
 
 
-@pytest.mark.asyncio
-async def test_quick_veto_temperature_room_rounded(
-    manager: SystemManager, resp: aioresponses
-) -> None:
-    url = urls.room_quick_veto(id="0", serial=SERIAL)
-    payload = payloads.room_quick_veto(22.5, 180)
-    resp.put(url, status=200)
-
-    qveto = QuickVeto(180, 22.7)
-    await manager.set_room_quick_veto("0", qveto)
-
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
-async def test_quick_veto_temperature_zone_rounded(
-    manager: SystemManager, resp: aioresponses
-) -> None:
-    url = urls.zone_quick_veto(id="zone1", serial=SERIAL)
-    payload = payloads.zone_quick_veto(22.5)
-    resp.put(url, status=200)
-
-    qveto = QuickVeto(duration=35, target=22.7)
-    await manager.set_zone_quick_veto("zone1", qveto)
-
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
 async def test_holiday_mode_temperature_rounded(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_holiday_mode(serial=SERIAL)
-    resp.put(url, status=200)
+    resp.put(_URL_HOLIDAY_MODE, status=200)
 
     tomorrow = date.today() + timedelta(days=1)
     after_tomorrow = tomorrow + timedelta(days=1)
@@ -440,52 +512,41 @@ async def test_holiday_mode_temperature_rounded(manager: SystemManager, resp: ai
 
     await manager.set_holiday_mode(tomorrow, after_tomorrow, 22.7)
 
-    _assert_calls(1, manager, [url], [payload])
+    _assert_calls(1, manager, [_URL_HOLIDAY_MODE], [payload])
 
 
-@pytest.mark.asyncio
 async def test_serial_not_fixed(session: ClientSession) -> None:
     manager = SystemManager("user", "pass", session, "pymultiMATIC")
     assert not manager._fixed_serial
 
 
-@pytest.mark.asyncio
 async def test_serial_not_fixed_login(session: ClientSession, resp: aioresponses) -> None:
     manager = SystemManager("user", "pass", session, "pymultiMATIC")
 
-    with open(path("files/responses/zone"), "r") as file:
-        raw_zone = json.loads(file.read())
+    raw_zone = load_response("zone")
 
-    url = urls.zone(serial=SERIAL, id="zone")
-    resp.get(url, payload=raw_zone, status=200)
+    resp.get(_URL_ZONE, payload=raw_zone, status=200)
 
     await manager.get_zone("zone")
     assert manager._serial == SERIAL
     assert not manager._fixed_serial
 
 
-@pytest.mark.asyncio
 async def test_serial_not_fixed_relogin(
     session: ClientSession, connector: Connector, resp: aioresponses
 ) -> None:
     manager = SystemManager("user", "pass", session, "pymultiMATIC")
 
-    with open(path("files/responses/zone"), "r") as file:
-        raw_zone = json.loads(file.read())
-
-    with open(path("files/responses/facilities"), "r") as file:
-        facilities = json.loads(file.read())
+    raw_zone = load_response("zone")
 
+    facilities = copy.deepcopy(load_response("facilities"))
     facilities["body"]["facilitiesList"][0]["serialNumber"] = "123"
 
-    url_zone1 = urls.zone(serial=SERIAL, id="zone")
     url_zone2 = urls.zone(serial="123", id="zone")
 
-    url_facilities = urls.facilities_list(serial=SERIAL)
-
-    resp.get(url_zone1, payload=raw_zone, status=200)
+    resp.get(_URL_ZONE, payload=raw_zone, status=200)
     resp.get(url_zone2, payload=raw_zone, status=200)
-    resp.get(url_facilities, payload=facilities, status=200)
+    resp.get(_URL_FACILITIES, payload=facilities, status=200)
 
     mock_auth(resp)
 
@@ -499,13 +560,11 @@ async def test_serial_not_fixed_relogin(
     assert manager._serial == "123"
 
 
-@pytest.mark.asyncio
 async def test_login(session: ClientSession) -> None:
     manager = SystemManager("user", "pass", session, "pymultiMATIC")
     assert await manager.login()
 
 
-@pytest.mark.asyncio
 async def test_logout_serial_not_fixed(session: ClientSession) -> None:
     manager = SystemManager("user", "pass", session, "pymultiMATIC")
     assert await manager.login()
@@ -513,290 +572,41 @@ async def test_logout_serial_not_fixed(session: ClientSession) -> None:
     assert manager._serial is None
 
 
-@pytest.mark.asyncio
-async def test_set_ventilation_operating_mode(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.set_ventilation_operating_mode(
-        serial=SERIAL,
-        id="123",
-    )
-    resp.put(url, status=200)
-
-    payload = payloads.ventilation_operating_mode("OFF")
-
-    await manager.set_ventilation_operating_mode("123", OperatingModes.OFF)
-
-    _assert_calls(1, manager, [url], [payload])
-
-
-@pytest.mark.asyncio
-async def test_get_gateway(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.gateway_type(
-        serial=SERIAL,
-    )
-    with open(path("files/responses/gateway"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    gateway = await manager.get_gateway()
-    assert gateway == "VR920"
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_quickmode(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_quickmode(
-        serial=SERIAL,
-    )
-    with open(path("files/responses/quick_mode"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    quickmode = await manager.get_quick_mode()
-    assert quickmode == QuickModes.SYSTEM_OFF
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
 async def test_get_quickmode_no_quickmode(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_quickmode(
-        serial=SERIAL,
-    )
-
-    resp.get(url, status=409)
+    resp.get(_URL_QUICK_MODE, status=409)
 
     quickmode = await manager.get_quick_mode()
     assert quickmode is None
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_outdoor_temperature(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_status(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/systemstatus"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    temp = await manager.get_outdoor_temperature()
-    assert temp == 12.5
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_hvac_status(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.hvac(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/hvacstate"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    await manager.get_hvac_status()
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_facility_detail_no_serial(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.facilities_list(
-        serial=SERIAL,
-    )
+    _assert_calls(1, manager, [_URL_QUICK_MODE])
 
-    with open(path("files/responses/facilities"), "r") as file:
-        json_raw = json.loads(file.read())
 
-    resp.get(url, status=200, payload=json_raw)
-
-    details = await manager.get_facility_detail()
-    assert details.serial_number == SERIAL
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
+@pytest.mark.no_facilities
 async def test_get_facility_detail_other_serial(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.facilities_list(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/facilities_multiple"), "r") as file:
-        json_raw = json.loads(file.read())
+    json_raw = load_response("facilities_multiple")
 
-    key = None
-    for match in resp._matches.items():
-        if match[1].url_or_pattern.path in urls.facilities_list():
-            key = match[0]
-    resp._matches.pop(key)
-    resp.get(url, status=200, payload=json_raw)
+    resp.get(_URL_FACILITIES, status=200, payload=json_raw)
 
     details = await manager.get_facility_detail("888")
     assert details.serial_number == "888"
-    _assert_calls(1, manager, [url])
+    _assert_calls(1, manager, [_URL_FACILITIES])
 
 
-@pytest.mark.asyncio
-async def test_get_live_reports(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.live_report(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/livereport"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    reports = await manager.get_live_reports()
-    assert reports is not None and len(reports) > 0
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_live_report(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.live_report_device(serial=SERIAL, report_id="1", device_id="2")
-
-    with open(path("files/responses/livereport_single"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    reports = await manager.get_live_report("1", "2")
-    assert reports is not None
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_holiday_mode(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_holiday_mode(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/holiday_mode"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    await manager.get_holiday_mode()
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_rooms(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.rooms(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/rooms"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    rooms = await manager.get_rooms()
-    assert rooms is not None and len(rooms) > 0
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_dhw(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.dhws(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/dhws"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    dhw = await manager.get_dhw()
-    assert dhw.hotwater is not None and dhw.circulation is not None
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_zones(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.zones(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/zones"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    zones = await manager.get_zones()
-    assert zones is not None and len(zones) > 0
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_ventilation(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.system_ventilation(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/ventilation"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    ventilation = await manager.get_ventilation()
-    assert ventilation is not None
-    _assert_calls(1, manager, [url])
-
-
-@pytest.mark.asyncio
-async def test_get_emf_devices(manager: SystemManager, resp: aioresponses) -> None:
-    url = urls.emf_devices(
-        serial=SERIAL,
-    )
-
-    with open(path("files/responses/emf_devices"), "r") as file:
-        json_raw = json.loads(file.read())
-
-    resp.get(url, status=200, payload=json_raw)
-
-    emf_reports = await manager.get_emf_devices()
-    assert emf_reports is not None
-    assert len(emf_reports) == 7
-    _assert_calls(1, manager, [url])
-
-
-def _mock_urls(
-    resp: aioresponses,
-    hvacstate_data: Any,
-    livereport_data: Any,
-    rooms_data: Any,
-    system_data: Any,
-    facilities: Any = None,
-    gateway: Any = None,
-) -> None:
-    resp.get(urls.live_report(serial=SERIAL), payload=livereport_data, status=200)
-    resp.get(urls.rooms(serial=SERIAL), payload=rooms_data, status=200)
-    resp.get(urls.system(serial=SERIAL), payload=system_data, status=200)
-    resp.get(urls.hvac(serial=SERIAL), payload=hvacstate_data, status=200)
-
-    if facilities:
-        resp.get(urls.facilities_list(), payload=facilities, status=200)
-
-    if gateway:
-        resp.get(urls.gateway_type(serial=SERIAL), payload=gateway, status=200)
+def _mock_urls(resp: aioresponses) -> None:
+    for url, fixture in _SYSTEM_MOCKS:
+        resp.get(url, payload=load_response(fixture), status=200)
 
 
 def _assert_calls(
     count: int,
     manager: SystemManager,
-    expected_urls: List[str] = None,
-    expected_payloads: List[Any] = None,
+    expected_urls: list[str] = None,
+    expected_payloads: list[Any] = None,
 ) -> None:
     calls = manager._connector.request.call_args_list  # type: ignore
     assert count == len(calls)
 
-    actual_urls: List[str] = []
-    actual_payloads: List[Dict[str, Any]] = []
+    actual_urls: list[str] = []
+    actual_payloads: list[dict[str, Any]] = []
 
     for call in calls:
         (args, kwargs) = call
@@ -804,14 +614,20 @@ def _assert_calls(
         actual_payloads.append(args[2])
 
     if expected_urls:
-        diff = [x for x in expected_urls if x not in actual_urls]
+        actual_urls_set = set(actual_urls)
+        diff = [x for x in expected_urls if x not in actual_urls_set]
         assert not diff
 
     if expected_payloads:
-        diff = [x for x in expected_payloads if x not in actual_payloads]
+        actual_payloads_set = {_payload_key(x) for x in actual_payloads}
+        diff = [x for x in expected_payloads if _payload_key(x) not in actual_payloads_set]
         assert not diff
 
 
+def _payload_key(payload: Any) -> str:
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
 def _api_error(status: int) -> ApiError:
     return ApiError(message="api error", response="blah", status=status)
 
@@ -837,15 +653,15 @@ def _wrong_response_error(status: int) -> ApiError:
         ),
     ],
 )
-@pytest.mark.asyncio
-async def test_retry_async(
-    on_exceptions: Tuple[Type[BaseException]],
-    on_status_codes: Tuple[int],
-    exception: Type[BaseException],
+def test_retry_async(
+    event_loop: asyncio.AbstractEventLoop,
+    on_exceptions: tuple[type[BaseException]],
+    on_status_codes: tuple[int],
+    exception: type[BaseException],
     should_retry: bool,
-    expect_ex: Type[BaseException],
+    expect_ex: type[BaseException],
 ) -> None:
-    cnt = {"cnt": 0}
+    cnt = 0
     num_tries = 3
 
     @retry_async(
@@ -855,10 +671,11 @@ async def test_retry_async(
         backoff_base=0,
     )
     async def func() -> None:
-        cnt["cnt"] += 1
+        nonlocal cnt
+        cnt += 1
         raise exception
 
     with pytest.raises(expect_ex.__class__):  # type: ignore
-        await func()
+        event_loop.run_until_complete(func())
 
-    assert cnt["cnt"] == (num_tries if should_retry else 1)
+    assert cnt == (num_tries if should_retry else 1)